@@ -8,17 +8,30 @@ import sys
 import os
 import signal
 import socket
-from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+import ctypes
+import ctypes.util
+import selectors
+import struct
+import collections
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import unquote_plus
 import logging
 
+try:
+    import orjson  # Optional, deutlich schneller als json
+except ImportError:
+    orjson = None
+
 # --- Konfiguration ---
 
 STREAM_INFO_FILE = "/tmp/current_stream.json"
 CONTROL_SOCKET = "/tmp/radio_control.sock"
 PID_FILE = "/tmp/radio.pid"
 
+# Control Socket: jede Nachricht ist <4 Byte Länge (big-endian)><Nutzdaten>
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 1024 * 1024
+
 # API-Konfiguration
 API_PORT = 8080
 API_HOST = "0.0.0.0"  # Auf allen Interfaces lauschen
@@ -35,6 +48,24 @@ PLAYLIST_PATH = "/home/masl/radioliste.m3u"
 # Lautstärke-Sprünge in Prozent (mpg123 nutzt 0..100)
 VOLUME_STEP = 5
 
+# Sekunden bis ein beendetes mpg123 per SIGKILL abgeschossen wird
+MPG123_KILL_TIMEOUT = 5
+
+# Wartezeit nach der letzten Drehung, bevor die Station wirklich wechselt (s)
+ROTATE_SETTLE_TIME = 0.4
+
+# ALSA-Mixer für die Lautstärke
+MIXER_CARD = "default"
+MIXER_CONTROL = "Master"
+
+# Muster für die Ausgabe von mpg123 -v (arbeiten direkt auf Bytes)
+STREAMTITLE_RE = re.compile(rb"StreamTitle='(.*?)'")
+ICY_NAME_RE = re.compile(rb"ICY-NAME:\s*(.*)")
+ICY_URL_RE = re.compile(rb"ICY-URL:\s*(.*)")
+MPEG_INFO_RE = re.compile(rb"MPEG.*?(\d+\s*kbit/s),\s*(\d+\s*kHz)\s*(Mono|Stereo)")
+LINE_SPLIT_RE = re.compile(rb"[\r\n]")  # mpg123 aktualisiert Statuszeilen mit \r
+MAX_LINE_LENGTH = 4096  # Längere Zeilen ohne Zeilenende enthalten keine Metadaten
+
 # --- Globale Variablen ---
 
 encoder = None
@@ -48,68 +79,164 @@ last_press_time = 0
 
 current_index = 0
 mpg123_proc = None
+player_lock = threading.RLock()  # Serialisiert Zustandswechsel aus API, CLI und GPIO
+stream_selector = selectors.DefaultSelector()  # stdout des laufenden mpg123
+stream_lock = threading.RLock()
+stream_reader = None
+stream_wakeup_recv = None  # Weckt den Leser, wenn ein neuer Stream angemeldet wird
+stream_wakeup_send = None
+dying_procs = collections.deque()  # (Prozess, Frist für SIGKILL)
+dying_cond = threading.Condition()  # Schützt dying_procs und weckt den Reaper
+proc_reaper = None
+_rotate_pending = None  # Zeitpunkt (monotonic) für den verzögerten Stationswechsel
 current_volume = 50  # Start-Lautstärke 50%
 current_info = {
     "stream_url": "",
     "title": "",
-    "timestamp": ""
+    "timestamp": 0
 }
 
+alsa_lib = None
+alsa_mixer = None
+alsa_elem = None
+alsa_volume_range = (0, 0)
+mixer_lock = threading.Lock()
+
 control_socket = None
+control_selector = None
+wakeup_recv = None  # Weckt die Hauptschleife aus select()
+wakeup_send = None
 api_server = None
 running = True
 
+# Gesetzt wenn current_info geändert wurde und noch nicht geschrieben ist
+_info_dirty = False
+
+# Serialisiertes current_info für /api/info, neu erzeugt nur nach Änderungen
+_current_info_json = None
+_current_info_dirty = True
+
+# /api/status: Vorlage ohne Zeitstempel, neu serialisiert nur nach Zustandsänderungen
+_status_template = {}
+_status_json_prefix = b""
+_status_playlist = None
+_status_dirty = True
+
+# Playlist wird nur neu eingelesen, wenn sich die Datei geändert hat.
+# Dazu die fertig serialisierten Einträge für /api/stations (inaktiv/aktiv).
+# Der Eintrag wird nie verändert, sondern immer als Ganzes ersetzt.
+_playlist_cache = {"mtime_ns": None, "urls": [], "stations_json": [], "stations_json_active": []}
+
 # Logging konfigurieren
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # --- API Handler ---
 
+def dumps_json(data):
+    """Serialisiert kompaktes JSON direkt als Bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode()
+
+# Statische API-Hilfe, wird nur einmal beim Import serialisiert
+HELP_DICT = {
+    "name": "Radio API",
+    "version": "1.0",
+    "endpoints": {
+        "GET /api/status": "Radio-Status abrufen",
+        "GET /api/info": "Detaillierte Stream-Informationen",
+        "GET /api/stations": "Liste aller verfügbaren Stationen",
+        "GET /api/play": "Wiedergabe starten",
+        "GET /api/stop": "Wiedergabe stoppen",
+        "GET /api/pause": "Wiedergabe pausieren/fortsetzen",
+        "GET /api/next": "Nächste Station",
+        "GET /api/prev": "Vorherige Station",
+        "GET /api/volume?level=50": "Lautstärke setzen (0-100)",
+        "GET /api/station?id=3": "Station wechseln (1-N)",
+        "POST /api/volume": "Lautstärke setzen (JSON: {\"level\": 50})",
+        "POST /api/station": "Station wechseln (JSON: {\"id\": 3})"
+    },
+    "examples": {
+        "curl": [
+            "curl http://localhost:8080/api/status",
+            "curl http://localhost:8080/api/play",
+            "curl -X POST -H 'Content-Type: application/json' -d '{\"level\":75}' http://localhost:8080/api/volume"
+        ]
+    }
+}
+HELP_JSON_BYTES = dumps_json(HELP_DICT)
+
+def get_query_param(query, key):
+    """Sucht einen einzelnen Parameter im Query-String"""
+    for pair in query.split('&'):
+        name, _, value = pair.partition('=')
+        if name == key and value:
+            return unquote_plus(value)
+    return None
+
+class RadioHTTPServer(ThreadingHTTPServer):
+    """HTTP-Server mit TCP_NODELAY für kleine JSON-Antworten"""
+    def get_request(self):
+        request, client_address = super().get_request()
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return request, client_address
+
 class RadioAPIHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 erlaubt Keep-Alive, jede Antwort braucht dafür Content-Length
+    protocol_version = "HTTP/1.1"
+    # Offene Keep-Alive-Verbindungen nach dieser Leerlaufzeit schließen (s)
+    timeout = 5
+    
+    # Pfad -> (Handler-Methode, Query-Parameter)
+    _GET_ROUTES = {
+        "/api/status": ("handle_status", None),
+        "/api/info": ("handle_info", None),
+        "/api/stations": ("handle_stations", None),
+        "/api/play": ("handle_play", None),
+        "/api/stop": ("handle_stop", None),
+        "/api/pause": ("handle_pause", None),
+        "/api/next": ("handle_next", None),
+        "/api/prev": ("handle_prev", None),
+        "/api/volume": ("handle_volume", "level"),
+        "/api/station": ("handle_station", "id"),
+        "/": ("handle_help", None),
+        "/api": ("handle_help", None),
+    }
+    
     def log_message(self, format, *args):
         # Reduziere HTTP-Logging
         pass
     
+    def end_headers(self):
+        if not self.close_connection:
+            self.send_header('Connection', 'keep-alive')
+        super().end_headers()
+    
     def do_GET(self):
         """Behandelt GET-Requests"""
-        parsed_url = urlparse(self.path)
-        path = parsed_url.path
-        params = parse_qs(parsed_url.query)
+        qidx = self.path.find('?')
+        path = self.path if qidx < 0 else self.path[:qidx]
+        query = "" if qidx < 0 else self.path[qidx + 1:]
         
         try:
-            if path == "/api/status":
-                self.handle_status()
-            elif path == "/api/info":
-                self.handle_info()
-            elif path == "/api/stations":
-                self.handle_stations()
-            elif path == "/api/play":
-                self.handle_play()
-            elif path == "/api/stop":
-                self.handle_stop()
-            elif path == "/api/pause":
-                self.handle_pause()
-            elif path == "/api/next":
-                self.handle_next()
-            elif path == "/api/prev":
-                self.handle_prev()
-            elif path == "/api/volume":
-                volume = params.get('level', [None])[0]
-                self.handle_volume(volume)
-            elif path == "/api/station":
-                station = params.get('id', [None])[0]
-                self.handle_station(station)
-            elif path == "/" or path == "/api":
-                self.handle_help()
-            else:
+            route = self._GET_ROUTES.get(path)
+            if route is None:
                 self.send_error(404, "Endpoint not found")
+                return
+            
+            handler_name, param = route
+            if param is None:
+                getattr(self, handler_name)()
+            else:
+                getattr(self, handler_name)(get_query_param(query, param))
         except Exception as e:
             logging.error(f"API Error: {e}")
             self.send_json_response({"error": str(e)}, 500)
     
     def do_POST(self):
         """Behandelt POST-Requests"""
-        parsed_url = urlparse(self.path)
-        path = parsed_url.path
+        qidx = self.path.find('?')
+        path = self.path if qidx < 0 else self.path[:qidx]
         
         try:
             content_length = int(self.headers.get('Content-Length', 0))
@@ -131,13 +258,18 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
     
     def send_json_response(self, data, status_code=200):
         """Sendet JSON-Response"""
+        self.send_json_bytes(dumps_json(data), status_code)
+    
+    def send_json_bytes(self, body, status_code=200):
+        """Sendet bereits serialisiertes JSON"""
         self.send_response(status_code)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self.wfile.write(body)
     
     def do_OPTIONS(self):
         """Behandelt CORS Preflight-Requests"""
@@ -145,38 +277,49 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def handle_status(self):
         """GET /api/status - Radio-Status"""
+        global _status_json_prefix, _status_playlist, _status_dirty
         playlist = read_playlist()
-        status = {
-            "status": "playing" if playback_state else "stopped",
-            "current_station": current_index + 1,
-            "total_stations": len(playlist),
-            "volume": current_volume,
-            "station_url": current_info.get("stream_url", ""),
-            "station_name": current_info.get("station_name", ""),
-            "title": current_info.get("title", ""),
-            "timestamp": datetime.now().isoformat()
-        }
-        self.send_json_response(status)
+        if _status_dirty or playlist is not _status_playlist:
+            _status_dirty = False
+            _status_playlist = playlist
+            _status_template.update({
+                "status": "playing" if playback_state else "stopped",
+                "current_station": current_index + 1,
+                "total_stations": len(playlist),
+                "volume": current_volume,
+                "station_url": current_info.get("stream_url", ""),
+                "station_name": current_info.get("station_name", ""),
+                "title": current_info.get("title", ""),
+            })
+            # Schließende Klammer abschneiden, der Zeitstempel kommt pro Request dazu
+            _status_json_prefix = dumps_json(_status_template)[:-1] + b',"timestamp":'
+        
+        # Unix-Zeit, Clients formatieren selbst
+        self.send_json_bytes(_status_json_prefix + repr(time.time()).encode() + b'}')
     
     def handle_info(self):
         """GET /api/info - Detaillierte Stream-Info"""
-        self.send_json_response(current_info)
+        global _current_info_json, _current_info_dirty
+        if _current_info_dirty or _current_info_json is None:
+            _current_info_dirty = False
+            _current_info_json = dumps_json(current_info)
+        self.send_json_bytes(_current_info_json)
     
     def handle_stations(self):
         """GET /api/stations - Liste aller Stationen"""
-        playlist = read_playlist()
-        stations = []
-        for i, url in enumerate(playlist):
-            stations.append({
-                "id": i + 1,
-                "url": url,
-                "active": i == current_index
-            })
-        self.send_json_response({"stations": stations})
+        playlist = load_playlist()
+        
+        # Vorgefertigte Einträge zusammensetzen, nur die aktive Station austauschen
+        entries = playlist["stations_json"]
+        index = current_index
+        if 0 <= index < len(entries):
+            entries = entries[:index] + [playlist["stations_json_active"][index]] + entries[index + 1:]
+        self.send_json_bytes(b'{"stations":[' + b','.join(entries) + b']}')
     
     def handle_play(self):
         """GET /api/play - Wiedergabe starten"""
@@ -221,39 +364,14 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
     
     def handle_help(self):
         """GET / oder /api - API-Hilfe"""
-        help_text = {
-            "name": "Radio API",
-            "version": "1.0",
-            "endpoints": {
-                "GET /api/status": "Radio-Status abrufen",
-                "GET /api/info": "Detaillierte Stream-Informationen",
-                "GET /api/stations": "Liste aller verfügbaren Stationen",
-                "GET /api/play": "Wiedergabe starten",
-                "GET /api/stop": "Wiedergabe stoppen",
-                "GET /api/pause": "Wiedergabe pausieren/fortsetzen",
-                "GET /api/next": "Nächste Station",
-                "GET /api/prev": "Vorherige Station",
-                "GET /api/volume?level=50": "Lautstärke setzen (0-100)",
-                "GET /api/station?id=3": "Station wechseln (1-N)",
-                "POST /api/volume": "Lautstärke setzen (JSON: {\"level\": 50})",
-                "POST /api/station": "Station wechseln (JSON: {\"id\": 3})"
-            },
-            "examples": {
-                "curl": [
-                    "curl http://localhost:8080/api/status",
-                    "curl http://localhost:8080/api/play",
-                    "curl -X POST -H 'Content-Type: application/json' -d '{\"level\":75}' http://localhost:8080/api/volume"
-                ]
-            }
-        }
-        self.send_json_response(help_text)
+        self.send_json_bytes(HELP_JSON_BYTES)
 
 def start_api_server():
-    """Startet den HTTP-API-Server"""
+    """Startet den HTTP-API-Server (ein Thread pro Verbindung)"""
     global api_server
     
     try:
-        api_server = HTTPServer((API_HOST, API_PORT), RadioAPIHandler)
+        api_server = RadioHTTPServer((API_HOST, API_PORT), RadioAPIHandler)
         logging.info(f"API-Server gestartet auf http://{API_HOST}:{API_PORT}")
         
         def serve_forever():
@@ -298,11 +416,44 @@ def is_daemon_running():
         
         # Prüfe ob Prozess existiert
         os.kill(pid, 0)
-        return True
     except (OSError, ValueError):
         # PID existiert nicht mehr, entferne verwaiste PID-Datei
         remove_pid_file()
         return False
+    
+    # Wiederverwendete PID eines fremden Prozesses erkennen
+    try:
+        with open(f"/proc/{pid}/comm", 'r') as f:
+            comm = f.read()
+    except OSError:
+        return True  # Kein /proc verfügbar, PID-Prüfung muss genügen
+    
+    if "python" not in comm:
+        # PID gehört inzwischen einem anderen Prozess
+        remove_pid_file()
+        return False
+    return True
+
+def send_frame(sock, data):
+    """Sendet eine Nachricht mit Längenpräfix"""
+    sock.sendall(FRAME_HEADER.pack(len(data)) + data)
+
+def recv_exact(sock, size):
+    """Liest genau size Bytes vom Socket"""
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("Verbindung vorzeitig geschlossen")
+        buf += chunk
+    return bytes(buf)
+
+def recv_frame(sock):
+    """Empfängt eine Nachricht mit Längenpräfix"""
+    (size,) = FRAME_HEADER.unpack(recv_exact(sock, FRAME_HEADER.size))
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Nachricht zu groß ({size} Bytes)")
+    return recv_exact(sock, size)
 
 def send_command(command):
     """Sendet Kommando an laufenden Daemon"""
@@ -313,8 +464,8 @@ def send_command(command):
     try:
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         sock.connect(CONTROL_SOCKET)
-        sock.send(command.encode())
-        response = sock.recv(1024).decode()
+        send_frame(sock, command.encode())
+        response = recv_frame(sock).decode()
         sock.close()
         print(response)
         return True
@@ -324,21 +475,132 @@ def send_command(command):
 
 # --- Stream-Funktionen ---
 
+def mark_info_changed():
+    """Merkt Änderungen an current_info für Datei und API vor"""
+    global _info_dirty, _current_info_dirty
+    _info_dirty = True
+    _current_info_dirty = True
+    invalidate_status()
+
+def invalidate_status():
+    """Erzwingt ein Neuaufbauen der /api/status-Antwort"""
+    global _status_dirty
+    _status_dirty = True
+
 def write_stream_info(info):
-    info["timestamp"] = datetime.now().isoformat()
+    global _current_info_dirty
+    info["timestamp"] = time.time()
+    _current_info_dirty = True
     try:
-        with open(STREAM_INFO_FILE, "w") as f:
-            json.dump(info, f, indent=2)
+        # Atomar schreiben, damit Leser nie eine halbe Datei sehen
+        data = json.dumps(info, indent=2).encode()
+        tmp_file = STREAM_INFO_FILE + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, STREAM_INFO_FILE)
     except Exception as e:
         logging.error(f"Beim Schreiben der Stream-Info: {e}")
 
 def metadata_updater():
     def update_loop():
+        global _info_dirty
         while running:
-            write_stream_info(current_info)
-            time.sleep(20)
+            # Höchstens ein Schreibvorgang pro Sekunde, und nur bei Änderungen
+            if _info_dirty:
+                _info_dirty = False
+                write_stream_info(current_info)
+            time.sleep(1)
     threading.Thread(target=update_loop, daemon=True).start()
 
+def decode_match(value):
+    """Dekodiert eine Regex-Gruppe aus der mpg123-Ausgabe"""
+    return value.decode('utf-8', 'replace').strip()
+
+def parse_mpg123_line(line):
+    """Übernimmt Metadaten aus einer Zeile der mpg123-Ausgabe"""
+
+    # Nur die gefundenen Gruppen dekodieren, nicht jede Zeile
+    if match := STREAMTITLE_RE.search(line):
+        current_info["title"] = decode_match(match.group(1))
+
+    elif match := ICY_NAME_RE.search(line):
+        current_info["station_name"] = decode_match(match.group(1))
+
+    elif match := ICY_URL_RE.search(line):
+        current_info["station_url"] = decode_match(match.group(1))
+
+    elif match := MPEG_INFO_RE.search(line):
+        current_info["bitrate"] = decode_match(match.group(1))
+        current_info["samplerate"] = decode_match(match.group(2))
+        current_info["channels"] = decode_match(match.group(3))
+
+    else:
+        return
+
+    mark_info_changed()
+
+def stream_reader_loop():
+    """Liest die Ausgabe aller registrierten mpg123-Prozesse in einem Thread"""
+    while running:
+        # Ohne Timeout: im Leerlauf (Pause) schläft der Thread bis zum nächsten Stream
+        for key, events in stream_selector.select():
+            if key.fileobj is stream_wakeup_recv:
+                drain_wakeup(stream_wakeup_recv)
+                continue
+            
+            with stream_lock:
+                # Zwischenzeitlich abgemeldet (Stationswechsel)?
+                if stream_selector.get_map().get(key.fd) is not key:
+                    continue
+                
+                try:
+                    chunk = os.read(key.fd, 4096)
+                except OSError:
+                    chunk = b""
+                if not chunk:
+                    release_stream_output(key.fileobj)
+                    continue
+                
+                buf = key.data
+                buf += chunk
+                end = max(buf.rfind(b"\n"), buf.rfind(b"\r"))
+                if end < 0:
+                    if len(buf) > MAX_LINE_LENGTH:
+                        buf.clear()
+                    continue
+                complete = bytes(buf[:end])
+                del buf[:end + 1]
+            
+            for line in LINE_SPLIT_RE.split(complete):
+                if line:
+                    parse_mpg123_line(line)
+
+def register_stream_output(proc):
+    """Meldet stdout eines mpg123-Prozesses beim gemeinsamen Leser an"""
+    global stream_reader, stream_wakeup_recv, stream_wakeup_send
+    with stream_lock:
+        if stream_reader is None:
+            stream_wakeup_recv, stream_wakeup_send = socket.socketpair()
+            stream_wakeup_recv.setblocking(False)
+            stream_wakeup_send.setblocking(False)
+            stream_selector.register(stream_wakeup_recv, selectors.EVENT_READ)
+            stream_reader = threading.Thread(target=stream_reader_loop, daemon=True)
+            stream_reader.start()
+        
+        stream_selector.register(proc.stdout, selectors.EVENT_READ, bytearray())
+    
+    # Laufendes select() soll die neue Pipe sofort berücksichtigen
+    wake_socket(stream_wakeup_send)
+
+def release_stream_output(stdout):
+    """Meldet stdout beim Leser ab und schließt die Pipe"""
+    with stream_lock:
+        try:
+            stream_selector.unregister(stdout)
+        except (KeyError, ValueError):
+            pass  # Bereits abgemeldet
+        stdout.close()
+
 def run_mpg123(url):
     global current_info
     current_info = {
@@ -349,100 +611,237 @@ def run_mpg123(url):
         "bitrate": "",
         "samplerate": "",
         "channels": "",
-        "timestamp": ""
+        "timestamp": 0
     }
+    mark_info_changed()
 
     proc = subprocess.Popen(
         ["mpg123", "-v", url],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+        start_new_session=True  # Eigene Prozessgruppe für killpg()
     )
 
-    def monitor_output():
-        streamtitle_re = re.compile(r"StreamTitle='(.*?)'")
-        icy_name_re = re.compile(r"ICY-NAME:\s*(.*)")
-        icy_url_re = re.compile(r"ICY-URL:\s*(.*)")
-        mpeg_info_re = re.compile(r"MPEG.*?(\d+\s*kbit/s),\s*(\d+\s*kHz)\s*(Mono|Stereo)")
-
-        for line in proc.stdout:
-            if not running:
-                break
-            line = line.strip()
-
-            if match := streamtitle_re.search(line):
-                current_info["title"] = match.group(1)
-
-            elif match := icy_name_re.search(line):
-                current_info["station_name"] = match.group(1)
-
-            elif match := icy_url_re.search(line):
-                current_info["station_url"] = match.group(1)
-
-            elif match := mpeg_info_re.search(line):
-                current_info["bitrate"] = match.group(1)
-                current_info["samplerate"] = match.group(2)
-                current_info["channels"] = match.group(3)
-
-            write_stream_info(current_info)
-
-    threading.Thread(target=monitor_output, daemon=True).start()
+    register_stream_output(proc)
     return proc
 
-def read_playlist():
-    urls = []
+def load_playlist():
+    """Liefert einen in sich konsistenten Playlist-Eintrag (URLs + Stations-JSON)"""
+    global _playlist_cache
     try:
+        mtime_ns = os.stat(PLAYLIST_PATH).st_mtime_ns
+        cache = _playlist_cache
+        if mtime_ns == cache["mtime_ns"]:
+            return cache
+        
+        urls = []
         with open(PLAYLIST_PATH, "r") as f:
             for line in f:
                 line = line.strip()
                 if line and not line.startswith("#"):
                     urls.append(line)
+        
+        entries = [b'{"id":%d,"url":%s,"active":' % (i + 1, dumps_json(url)) for i, url in enumerate(urls)]
+        cache = {
+            "mtime_ns": mtime_ns,
+            "urls": urls,
+            "stations_json": [entry + b'false}' for entry in entries],
+            "stations_json_active": [entry + b'true}' for entry in entries],
+        }
+        _playlist_cache = cache
+        return cache
     except Exception as e:
         logging.error(f"Playlist lesen: {e}")
-    return urls
+    return {"mtime_ns": None, "urls": [], "stations_json": [], "stations_json_active": []}
+
+def read_playlist():
+    return load_playlist()["urls"]
+
+def init_alsa_mixer():
+    """Öffnet den ALSA-Mixer direkt über libasound (ohne amixer-Prozesse)"""
+    global alsa_lib, alsa_mixer, alsa_elem, alsa_volume_range
+    
+    try:
+        lib = ctypes.CDLL(ctypes.util.find_library("asound") or "libasound.so.2")
+    except OSError as e:
+        logging.warning(f"libasound nicht verfügbar, nutze amixer: {e}")
+        return False
+    
+    lib.snd_mixer_open.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_int]
+    lib.snd_mixer_attach.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    lib.snd_mixer_selem_register.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p]
+    lib.snd_mixer_load.argtypes = [ctypes.c_void_p]
+    lib.snd_mixer_close.argtypes = [ctypes.c_void_p]
+    lib.snd_mixer_selem_id_malloc.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    lib.snd_mixer_selem_id_free.argtypes = [ctypes.c_void_p]
+    lib.snd_mixer_selem_id_set_index.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    lib.snd_mixer_selem_id_set_name.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    lib.snd_mixer_find_selem.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    lib.snd_mixer_find_selem.restype = ctypes.c_void_p
+    lib.snd_mixer_selem_get_playback_volume_range.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long)]
+    lib.snd_mixer_selem_set_playback_volume_all.argtypes = [ctypes.c_void_p, ctypes.c_long]
+    
+    mixer = ctypes.c_void_p()
+    if lib.snd_mixer_open(ctypes.byref(mixer), 0) < 0:
+        logging.warning("ALSA-Mixer öffnen fehlgeschlagen, nutze amixer")
+        return False
+    
+    try:
+        if lib.snd_mixer_attach(mixer, MIXER_CARD.encode()) < 0 \
+                or lib.snd_mixer_selem_register(mixer, None, None) < 0 \
+                or lib.snd_mixer_load(mixer) < 0:
+            raise OSError(f"Karte '{MIXER_CARD}' nicht verfügbar")
+        
+        sid = ctypes.c_void_p()
+        if lib.snd_mixer_selem_id_malloc(ctypes.byref(sid)) < 0:
+            raise OSError("snd_mixer_selem_id_malloc")
+        lib.snd_mixer_selem_id_set_index(sid, 0)
+        lib.snd_mixer_selem_id_set_name(sid, MIXER_CONTROL.encode())
+        elem = lib.snd_mixer_find_selem(mixer, sid)
+        lib.snd_mixer_selem_id_free(sid)
+        if not elem:
+            raise OSError(f"Regler '{MIXER_CONTROL}' nicht gefunden")
+        
+        vmin, vmax = ctypes.c_long(), ctypes.c_long()
+        lib.snd_mixer_selem_get_playback_volume_range(elem, ctypes.byref(vmin), ctypes.byref(vmax))
+    except OSError as e:
+        lib.snd_mixer_close(mixer)
+        logging.warning(f"ALSA-Mixer nicht nutzbar, nutze amixer: {e}")
+        return False
+    
+    alsa_lib = lib
+    alsa_mixer = mixer
+    alsa_elem = ctypes.c_void_p(elem)
+    alsa_volume_range = (vmin.value, vmax.value)
+    logging.info(f"ALSA-Mixer '{MIXER_CONTROL}' geöffnet")
+    return True
 
 def set_volume(change):
     global current_volume
     current_volume = max(0, min(100, current_volume + change))
+    invalidate_status()
     try:
-        subprocess.run(["amixer", "sset", "Master", f"{current_volume}%"], check=True, stdout=subprocess.DEVNULL)
+        # Handle nur unter dem Lock lesen, cleanup() schließt den Mixer parallel
+        with mixer_lock:
+            elem = alsa_elem
+            if elem is not None:
+                # Prozent wie amixer linear auf den Reglerbereich abbilden
+                vmin, vmax = alsa_volume_range
+                value = vmin + round((vmax - vmin) * current_volume / 100)
+                ret = alsa_lib.snd_mixer_selem_set_playback_volume_all(elem, value)
+                if ret < 0:
+                    raise OSError(f"snd_mixer_selem_set_playback_volume_all: {ret}")
+        
+        if elem is None:
+            subprocess.run(["amixer", "sset", MIXER_CONTROL, f"{current_volume}%"], check=True, stdout=subprocess.DEVNULL)
         logging.info(f"Lautstärke auf {current_volume}% gesetzt")
     except Exception as e:
         logging.error(f"Lautstärke setzen: {e}")
 
+def stop_mpg123(proc):
+    """Beendet mpg123 ohne zu warten, das Abräumen übernimmt reap_loop()"""
+    global proc_reaper
+    release_stream_output(proc.stdout)
+    if proc.poll() is not None:
+        return
+    
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    
+    with dying_cond:
+        if not any(p is proc for p, deadline in dying_procs):
+            dying_procs.append((proc, time.monotonic() + MPG123_KILL_TIMEOUT))
+            dying_cond.notify()
+        
+        if proc_reaper is None:
+            proc_reaper = threading.Thread(target=reap_loop, daemon=True)
+            proc_reaper.start()
+
+def reap_loop():
+    """Räumt beendete mpg123-Prozesse ab, hängende werden nach Frist gekillt"""
+    with dying_cond:
+        while True:
+            # Ohne sterbende Prozesse schläft der Reaper, bis stop_mpg123() ihn weckt
+            while running and not dying_procs:
+                dying_cond.wait()
+            if not running:
+                return
+            
+            dying_cond.wait(timeout=1)  # Den Prozessen Zeit zum Beenden geben
+            for _ in range(len(dying_procs)):
+                proc, deadline = dying_procs.popleft()
+                if proc.poll() is not None:  # waitpid(WNOHANG)
+                    continue
+                if time.monotonic() >= deadline:
+                    try:
+                        os.killpg(proc.pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                dying_procs.append((proc, deadline))
+
 def play_stream(index):
     global current_index, mpg123_proc
 
-    playlist = read_playlist()
-    if not playlist:
-        logging.error("Playlist ist leer.")
-        return
+    with player_lock:
+        playlist = read_playlist()
+        if not playlist:
+            logging.error("Playlist ist leer.")
+            return
 
-    current_index = index % len(playlist)
-    url = playlist[current_index]
+        current_index = index % len(playlist)
+        invalidate_status()
+        url = playlist[current_index]
 
-    if mpg123_proc:
-        mpg123_proc.terminate()
-        mpg123_proc.wait()
+        if mpg123_proc:
+            stop_mpg123(mpg123_proc)
 
-    logging.info(f"Starte Stream {current_index + 1}/{len(playlist)}: {url}")
-    mpg123_proc = run_mpg123(url)
+        logging.info(f"Starte Stream {current_index + 1}/{len(playlist)}: {url}")
+        mpg123_proc = run_mpg123(url)
+
+def schedule_station_change():
+    """Startet current_index erst nach ROTATE_SETTLE_TIME ohne weitere Drehung"""
+    global _rotate_pending
+    _rotate_pending = time.monotonic() + ROTATE_SETTLE_TIME
+    invalidate_status()
+    wake_main_loop()
+
+def run_pending_station_change():
+    """Führt einen fälligen Stationswechsel aus, liefert die Wartezeit bis zum nächsten"""
+    global _rotate_pending
+    if _rotate_pending is None:
+        return None
+    
+    remaining = _rotate_pending - time.monotonic()
+    if remaining > 0:
+        return remaining
+    
+    _rotate_pending = None
+    try:
+        play_stream(current_index)
+    except Exception as e:
+        # Ein fehlgeschlagener Wechsel darf die Hauptschleife nicht beenden
+        logging.error(f"Stationswechsel: {e}")
+    return None
 
 def toggle_play_pause():
     global playback_state, mpg123_proc
-    if mpg123_proc is None:
-        play_stream(current_index)
-        playback_state = True
-    else:
-        if playback_state:
-            mpg123_proc.terminate()
-            playback_state = False
-            logging.info("Wiedergabe pausiert")
-        else:
+    with player_lock:
+        if mpg123_proc is None:
             play_stream(current_index)
             playback_state = True
-            logging.info("Wiedergabe gestartet")
+        else:
+            if playback_state:
+                stop_mpg123(mpg123_proc)
+                playback_state = False
+                logging.info("Wiedergabe pausiert")
+            else:
+                play_stream(current_index)
+                playback_state = True
+                logging.info("Wiedergabe gestartet")
+        invalidate_status()
 
 # --- GPIO Handler ---
 
@@ -466,12 +865,14 @@ def init_gpio():
         return False
 
     def on_rotate():
-        global button_pressed
+        global button_pressed, current_index
         if button_pressed:
-            if encoder.steps > 0:
-                play_stream(current_index + 1)
-            elif encoder.steps < 0:
-                play_stream(current_index - 1)
+            # Nur den Index weiterzählen; gestartet wird erst, wenn die Drehung ruht
+            playlist = read_playlist()
+            if playlist and encoder.steps != 0:
+                step = 1 if encoder.steps > 0 else -1
+                current_index = (current_index + step) % len(playlist)
+                schedule_station_change()
         else:
             if encoder.steps > 0:
                 set_volume(VOLUME_STEP)
@@ -498,9 +899,11 @@ def init_gpio():
 
     def on_alarm_released():
         global playback_state
-        if not playback_state:
-            play_stream(current_index)
-            playback_state = True
+        with player_lock:
+            if not playback_state:
+                play_stream(current_index)
+                playback_state = True
+                invalidate_status()
 
     encoder.when_rotated = on_rotate
     encoder_button.when_pressed = on_button_pressed
@@ -515,95 +918,97 @@ def process_command(command):
     """Verarbeitet empfangene Kommandos"""
     global current_volume, playback_state, running
     
-    parts = command.strip().split()
-    if not parts:
-        return "ERROR: Leeres Kommando"
-    
-    cmd = parts[0].lower()
-    
-    if cmd == "play" or cmd == "p":
-        if not playback_state:
-            toggle_play_pause()
-        return "OK: Wiedergabe gestartet"
-    
-    elif cmd == "stop" or cmd == "s":
-        if playback_state:
+    with player_lock:
+        parts = command.strip().split()
+        if not parts:
+            return "ERROR: Leeres Kommando"
+        
+        cmd = parts[0].lower()
+        
+        if cmd == "play" or cmd == "p":
+            if not playback_state:
+                toggle_play_pause()
+            return "OK: Wiedergabe gestartet"
+        
+        elif cmd == "stop" or cmd == "s":
+            if playback_state:
+                toggle_play_pause()
+            return "OK: Wiedergabe gestoppt"
+        
+        elif cmd == "pause":
             toggle_play_pause()
-        return "OK: Wiedergabe gestoppt"
-    
-    elif cmd == "pause":
-        toggle_play_pause()
-        return f"OK: {'Pause' if not playback_state else 'Play'}"
-    
-    elif cmd == "next" or cmd == "n":
-        play_stream(current_index + 1)
-        return f"OK: Nächster Stream ({current_index + 1})"
-    
-    elif cmd == "prev" or cmd == "previous":
-        play_stream(current_index - 1)
-        return f"OK: Vorheriger Stream ({current_index + 1})"
-    
-    elif cmd == "station":
-        if len(parts) > 1:
-            try:
-                index = int(parts[1]) - 1
-                if index >= 0:
-                    play_stream(index)
-                    return f"OK: Station {index + 1} gestartet"
-                else:
-                    return "ERROR: Ungültige Stationsnummer"
-            except ValueError:
-                return "ERROR: Stationsnummer muss eine Zahl sein"
-        else:
-            return f"OK: Aktuelle Station: {current_index + 1}"
-    
-    elif cmd == "volume" or cmd == "v":
-        if len(parts) > 1:
-            try:
-                if parts[1].startswith('+'):
-                    change = int(parts[1][1:])
-                    set_volume(change)
-                elif parts[1].startswith('-'):
-                    change = -int(parts[1][1:])
-                    set_volume(change)
-                else:
-                    target = int(parts[1])
-                    set_volume(target - current_volume)
-                return f"OK: Lautstärke: {current_volume}%"
-            except ValueError:
-                return "ERROR: Ungültiger Lautstärke-Wert"
+            return f"OK: {'Pause' if not playback_state else 'Play'}"
+        
+        elif cmd == "next" or cmd == "n":
+            play_stream(current_index + 1)
+            return f"OK: Nächster Stream ({current_index + 1})"
+        
+        elif cmd == "prev" or cmd == "previous":
+            play_stream(current_index - 1)
+            return f"OK: Vorheriger Stream ({current_index + 1})"
+        
+        elif cmd == "station":
+            if len(parts) > 1:
+                try:
+                    index = int(parts[1]) - 1
+                    if index >= 0:
+                        play_stream(index)
+                        return f"OK: Station {index + 1} gestartet"
+                    else:
+                        return "ERROR: Ungültige Stationsnummer"
+                except ValueError:
+                    return "ERROR: Stationsnummer muss eine Zahl sein"
+            else:
+                return f"OK: Aktuelle Station: {current_index + 1}"
+        
+        elif cmd == "volume" or cmd == "v":
+            if len(parts) > 1:
+                try:
+                    if parts[1].startswith('+'):
+                        change = int(parts[1][1:])
+                        set_volume(change)
+                    elif parts[1].startswith('-'):
+                        change = -int(parts[1][1:])
+                        set_volume(change)
+                    else:
+                        target = int(parts[1])
+                        set_volume(target - current_volume)
+                    return f"OK: Lautstärke: {current_volume}%"
+                except ValueError:
+                    return "ERROR: Ungültiger Lautstärke-Wert"
+            else:
+                return f"OK: Aktuelle Lautstärke: {current_volume}%"
+        
+        elif cmd == "status":
+            playlist = read_playlist()
+            return f"OK: Station {current_index + 1}/{len(playlist)}, " \
+                   f"Lautstärke: {current_volume}%, " \
+                   f"Status: {'Playing' if playback_state else 'Stopped'}"
+        
+        elif cmd == "info":
+            return json.dumps(current_info, indent=2)
+        
+        elif cmd == "list":
+            playlist = read_playlist()
+            result = "Verfügbare Stationen:\n"
+            for i, url in enumerate(playlist, 1):
+                marker = " *" if i-1 == current_index else "  "
+                result += f"{marker} {i}: {url}\n"
+            return result.rstrip()
+        
+        elif cmd == "quit" or cmd == "exit":
+            running = False
+            wake_main_loop()
+            return "OK: Beende Radio-Daemon"
+        
         else:
-            return f"OK: Aktuelle Lautstärke: {current_volume}%"
-    
-    elif cmd == "status":
-        playlist = read_playlist()
-        return f"OK: Station {current_index + 1}/{len(playlist)}, " \
-               f"Lautstärke: {current_volume}%, " \
-               f"Status: {'Playing' if playback_state else 'Stopped'}"
-    
-    elif cmd == "info":
-        return json.dumps(current_info, indent=2)
-    
-    elif cmd == "list":
-        playlist = read_playlist()
-        result = "Verfügbare Stationen:\n"
-        for i, url in enumerate(playlist, 1):
-            marker = " *" if i-1 == current_index else "  "
-            result += f"{marker} {i}: {url}\n"
-        return result.rstrip()
-    
-    elif cmd == "quit" or cmd == "exit":
-        running = False
-        return "OK: Beende Radio-Daemon"
-    
-    else:
-        return f"ERROR: Unbekanntes Kommando '{cmd}'\n" \
-               "Verfügbare Kommandos: play, stop, pause, next, prev, station [nr], " \
-               "volume [+/-]wert, status, info, list, quit"
+            return f"ERROR: Unbekanntes Kommando '{cmd}'\n" \
+                   "Verfügbare Kommandos: play, stop, pause, next, prev, station [nr], " \
+                   "volume [+/-]wert, status, info, list, quit"
 
 def setup_control_socket():
     """Erstellt Control Socket für CLI-Kommandos"""
-    global control_socket
+    global control_socket, control_selector, wakeup_recv, wakeup_send
     
     # Entferne alten Socket falls vorhanden
     if os.path.exists(CONTROL_SOCKET):
@@ -612,32 +1017,96 @@ def setup_control_socket():
     control_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     control_socket.bind(CONTROL_SOCKET)
     control_socket.listen(1)
+    control_socket.setblocking(False)
     
-    def handle_connections():
-        while running:
-            try:
-                conn, addr = control_socket.accept()
-                command = conn.recv(1024).decode()
-                response = process_command(command)
-                conn.send(response.encode())
-                conn.close()
-            except Exception as e:
-                if running:  # Nur loggen wenn wir nicht beim Beenden sind
-                    logging.error(f"Socket-Verbindung: {e}")
-                break
+    # Verbindungen werden von der Hauptschleife in main() abgearbeitet
+    control_selector = selectors.DefaultSelector()
+    control_selector.register(control_socket, selectors.EVENT_READ)
     
-    threading.Thread(target=handle_connections, daemon=True).start()
+    wakeup_recv, wakeup_send = socket.socketpair()
+    wakeup_recv.setblocking(False)
+    wakeup_send.setblocking(False)
+    control_selector.register(wakeup_recv, selectors.EVENT_READ)
+
+def wake_main_loop():
+    """Unterbricht das Warten der Hauptschleife"""
+    wake_socket(wakeup_send)
+
+def wake_socket(sock):
+    """Schreibt ein Weck-Byte, um ein wartendes select() zu unterbrechen"""
+    if sock is None:
+        return
+    try:
+        sock.send(b"\0")
+    except (BlockingIOError, OSError):
+        pass  # Schleife ist ohnehin schon geweckt oder beendet
+
+def drain_wakeup(sock):
+    """Verwirft angesammelte Weck-Bytes"""
+    try:
+        while sock.recv(64):
+            pass
+    except BlockingIOError:
+        pass
+
+def handle_control_connection():
+    """Beantwortet eine wartende CLI-Verbindung"""
+    try:
+        conn, addr = control_socket.accept()
+    except BlockingIOError:
+        return
+    
+    try:
+        # Ein hängender Client darf die Hauptschleife nicht blockieren
+        conn.settimeout(1.0)
+        command = recv_frame(conn).decode()
+        response = process_command(command)
+        send_frame(conn, response.encode())
+    except Exception as e:
+        if running:  # Nur loggen wenn wir nicht beim Beenden sind
+            logging.error(f"Socket-Verbindung: {e}")
+    finally:
+        conn.close()
 
 def cleanup():
     """Cleanup-Funktion beim Beenden"""
-    global running, mpg123_proc, control_socket, api_server
+    global running, mpg123_proc, control_socket, control_selector, api_server, alsa_mixer, alsa_elem
     
     logging.info("Beende Radiowecker...")
     running = False
+    wake_socket(stream_wakeup_send)
     
     if mpg123_proc:
-        mpg123_proc.terminate()
-        mpg123_proc.wait()
+        stop_mpg123(mpg123_proc)
+    
+    # Beim Beenden dem Reaper die Prozesse abnehmen und selbst auf sie warten
+    with dying_cond:
+        remaining = list(dying_procs)
+        dying_procs.clear()
+        dying_cond.notify_all()
+    
+    for proc, deadline in remaining:
+        try:
+            proc.wait(timeout=max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.wait()
+    
+    if alsa_mixer is not None:
+        with mixer_lock:
+            alsa_elem = None
+            alsa_lib.snd_mixer_close(alsa_mixer)
+            alsa_mixer = None
+    
+    if control_selector:
+        control_selector.close()
+    
+    for sock in (wakeup_recv, wakeup_send):
+        if sock:
+            sock.close()
     
     if control_socket:
         control_socket.close()
@@ -720,6 +1189,7 @@ def main():
             setup_control_socket()
             metadata_updater()
             play_stream(current_index)
+            init_alsa_mixer()
             set_volume(current_volume)
             
             logging.info(f"Radiowecker gestartet (PID: {os.getpid()})")
@@ -728,8 +1198,15 @@ def main():
             logging.info(f"Control Socket: {CONTROL_SOCKET}")
             logging.info(f"REST-API: http://{API_HOST}:{API_PORT}")
             
+            # Kein Polling: select() kehrt nur bei Verbindungen, wake_main_loop()
+            # oder einem anstehenden Stationswechsel zurück
             while running:
-                time.sleep(0.1)
+                timeout = run_pending_station_change()
+                for key, events in control_selector.select(timeout):
+                    if key.fileobj is control_socket:
+                        handle_control_connection()
+                    else:
+                        drain_wakeup(key.fileobj)
                 
         except Exception as e:
             logging.error(f"Daemon-Fehler: {e}")
@@ -737,7 +1214,8 @@ def main():
             cleanup()
     
     elif command == "status":
-        if is_daemon_running():
+        # Schneller Weg: ohne Control Socket kann kein Daemon laufen
+        if os.path.exists(CONTROL_SOCKET) and is_daemon_running():
             print("Radio-Daemon läuft.")
             send_command("status")
         else:
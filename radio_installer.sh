@@ -72,6 +72,8 @@ install_dependencies() {
     
     print_status "Installiere Python-Abhängigkeiten..."
     pip3 install --user gpiozero
+    # Optional: schnellere JSON-Serialisierung für die REST-API
+    pip3 install --user orjson || print_warning "orjson nicht installiert, API nutzt json aus der Standardbibliothek"
     
     # GPIO-Gruppe hinzufügen
     sudo usermod -a -G gpio $INSTALL_USER || true